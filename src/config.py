@@ -37,3 +37,27 @@ class EditorConfig:
 
     SPACES_PER_TAB: int = 4
     INDENTATION_CHAR: str = ' '
+
+    _INDENT_CACHE: list[str] = ['']
+
+    @classmethod
+    def indent_prefix(cls, indentation_level: int) -> str:
+        """Get the indentation prefix for a given level.
+
+        Prefixes are built lazily up to the deepest level requested and
+        memoized on the class, so each one is computed at most once.
+
+        Args:
+            indentation_level (int): the indentation level.
+
+        Returns:
+            str: the indentation prefix.
+        """
+        cache = cls._INDENT_CACHE
+
+        while len(cache) <= indentation_level:
+            cache.append(
+                cache[-1] + cls.SPACES_PER_TAB * cls.INDENTATION_CHAR
+            )
+
+        return cache[indentation_level]
@@ -11,6 +11,8 @@ Authors:
 
 from __future__ import annotations
 
+from functools import total_ordering
+from itertools import islice
 from typing import Any
 
 import regex as re
@@ -26,42 +28,117 @@ class Expression:
 
     Attributes:
         body (str): line of code.
-        OPERATORS (dict[str, str]): dictionary of operator translations.
-        IDENTIFIERS (dict[str, str]): dictionary of identifier translations.
+        OPERATORS (tuple[tuple[str, str], ...]): ordered operator
+            translation pairs.
+        IDENTIFIERS (tuple[tuple[str, str], ...]): ordered identifier
+            translation pairs.
         REPR_LIMIT (int): the character limit for the collapsed representation
             of the expression.
     """
 
-    OPERATORS: dict[str, str] = {
-        r"\/\/": '#',
-        r'(.*[^<>!])=(.*)': r"\1 == \2",
-        r"(.*?)\s*<-\s*(.*)": r"\1 = \2",
-        r"(.*?)\s*<>\s*(.*)": r"\1 != \2",
-        r"(.*?)\s*MOD\s*(.*)": r"\1 % \2",
-        r"(.*?)\s*==\s*(.*)": r"\1 == \2",
-        r"\b(\w+)\s*<\s*(\w+)\b": r"\1 < \2",
-        r"\b(\w+)\s*>\s*(\w+)\b": r"\1 > \2",
-        r"(.*?)\s*<=\s*(.*)": r"\1 <= \2",
-        r"(.*?)\s*>=\s*(.*)": r"\1 >= \2",
-        r"(.*?)\s*\+\s*(.*)": r"\1 + \2",
-        r"(.*?)\s*-\s*(.*)": r"\1 - \2",
-        r"(.*?)\s*\*\s*(.*)": r"\1 * \2",
-        r"(.*?)\s*\/\s*(.*)": r"\1 / \2"
+    OPERATORS: tuple[tuple[str, str], ...] = (
+        (r"\/\/", '#'),
+        (r'(.*[^<>!])=(.*)', r"\1 == \2"),
+        (r"(.*?)\s*<-\s*(.*)", r"\1 = \2"),
+        (r"(.*?)\s*<>\s*(.*)", r"\1 != \2"),
+        (r"(.*?)\s*MOD\s*(.*)", r"\1 % \2"),
+        (r"(.*?)\s*==\s*(.*)", r"\1 == \2"),
+        (r"\b(\w+)\s*<\s*(\w+)\b", r"\1 < \2"),
+        (r"\b(\w+)\s*>\s*(\w+)\b", r"\1 > \2"),
+        (r"(.*?)\s*<=\s*(.*)", r"\1 <= \2"),
+        (r"(.*?)\s*>=\s*(.*)", r"\1 >= \2"),
+        (r"(.*?)\s*\+\s*(.*)", r"\1 + \2"),
+        (r"(.*?)\s*-\s*(.*)", r"\1 - \2"),
+        (r"(.*?)\s*\*\s*(.*)", r"\1 * \2"),
+        (r"(.*?)\s*\/\s*(.*)", r"\1 / \2")
+    )
+
+    IDENTIFIERS: tuple[tuple[str, str], ...] = (
+        (r"ESCRIBIR\s*\((.*)\)", r"print(\1)"),
+        (r"LEER\s*\((.*)\)", r"\1 = input()"),
+        (r"DEVOLVER\s*(.*)", r"return \1"),
+        (r"Entero", "int"),
+        (r"Real", "float"),
+        (r"Car.?cter", "str"),
+        (r"Cadena", "str"),
+        (r"L.?gico", "bool"),
+        (r"Registro.*", "Registro()")
+    )
+
+    REPR_LIMIT: int = 15
+
+    __slots__ = ("_body",)
+
+    # The comment marker is a plain literal, so the fallback handles it
+    # with str.replace instead of the regex machinery:
+    _COMPILED_OPERATORS = tuple(
+        (re.compile(expression, RegexConfig.FLAGS), replacement)
+        for expression, replacement in OPERATORS
+        if expression != r"\/\/"
+    )
+
+    _COMPILED_IDENTIFIERS = tuple(
+        (re.compile(expression, RegexConfig.FLAGS), replacement)
+        for expression, replacement in IDENTIFIERS
+    )
+
+    _OPERATOR_GUARD = re.compile(r"[-+*/<>=]|MOD", RegexConfig.FLAGS)
+
+    _IDENTIFIER_GUARD = re.compile(
+        r"ESCRIBIR|LEER|DEVOLVER|Entero|Real|Car.?cter|Cadena|L.?gico"
+        r"|Registro",
+        RegexConfig.FLAGS
+    )
+
+    _WORD_CHARS = frozenset(
+        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_."
+    )
+
+    _OPERATOR_CHARS = frozenset("+-*/<>=")
+
+    _DIGRAPHS: dict[str, str] = {
+        "<-": '=',
+        "<>": "!=",
+        "<=": "<=",
+        ">=": ">="
     }
 
-    IDENTIFIERS: dict[str, str] = {
-        r"ESCRIBIR\s*\((.*)\)": r"print(\1)",
-        r"LEER\s*\((.*)\)": r"\1 = input()",
-        r"DEVOLVER\s*(.*)": r"return \1",
-        r"Entero": "int",
-        r"Real": "float",
-        r"Car.?cter": "str",
-        r"Cadena": "str",
-        r"L.?gico": "bool",
-        r"Registro.*": "Registro()"
+    _SINGLE_OPERATORS: dict[str, str] = {
+        '=': "==",
+        '<': '<',
+        '>': '>',
+        '+': '+',
+        '-': '-',
+        '*': '*',
+        '/': '/'
     }
 
-    REPR_LIMIT: int = 15
+    _KEYWORDS: dict[str, str] = {
+        "entero": "int",
+        "real": "float",
+        "caracter": "str",
+        "carcter": "str",
+        "cadena": "str",
+        "logico": "bool",
+        "lgico": "bool"
+    }
+
+    _KEYWORD_STEMS: tuple[str, ...] = (
+        "escribir", "leer", "devolver", "registro", "entero", "real",
+        "cadena", "caracter", "carcter", "logico", "lgico", "mod"
+    )
+
+    _KEYWORD_FRAGMENTS: frozenset[str] = frozenset(
+        ("car", "cter", 'l', "gico")
+    )
+
+    _TRIVIAL: frozenset[str] = frozenset((
+        '', "inicio", "hacer", "fin", "fin_si", "fin_desde", "fin_mientras",
+        "fin_caso", "fin_funcion", "fin_procedimiento"
+    ))
+
+    _TRANSLATION_CACHE: dict[str, str] = {}
+    _TRANSLATION_CACHE_LIMIT: int = 8192
 
     def __init__(self, code: str) -> None:
         """Initialize the expression.
@@ -69,7 +146,10 @@ class Expression:
         Args:
             code (str): body of the expression.
         """
-        self.body = code.strip()
+        # Writing the slot directly skips a property dispatch on the
+        # constructor hot path; the setter remains for external writes.
+        self._body = code.strip()
+        self._translate()
 
     @property
     def body(self) -> str:
@@ -91,12 +171,208 @@ class Expression:
         self._translate()
 
     def _translate(self):
-        """Translate the expression into a valid Python statement."""
-        self._body = self._translate_identifiers(
-            self._translate_operators(
-                self._body
-            )
-        )
+        """Translate the expression into a valid Python statement.
+
+        Translations are memoized by source string, so that repeated lines
+        (and re-translations of the same program) only pay the translation
+        cost once. Trivial lines (empty strings and structural keywords that
+        no translation ever rewrites) skip the translator entirely.
+        """
+        if self._body.lower() in self._TRIVIAL:
+            return
+
+        cache = Expression._TRANSLATION_CACHE
+        translated = cache.get(self._body)
+
+        if translated is None:
+            translated = self._translate_tokens(self._body)
+
+            if translated is None:
+                translated = self._translate_identifiers(
+                    self._translate_operators(
+                        self._body
+                    )
+                )
+
+            if len(cache) >= self._TRANSLATION_CACHE_LIMIT:
+                cache.clear()
+
+            cache[self._body] = translated
+
+        self._body = translated
+
+    @classmethod
+    def _tokenize(cls, code: str) -> list[tuple[str, str]] | None:
+        """Split the expression into word, whitespace and operator tokens.
+
+        Args:
+            code (str): body of the expression.
+
+        Returns:
+            list[tuple[str, str]] | None: the (kind, text) token list or
+                None, if the expression contains characters outside the
+                tokenizer's scope.
+        """
+        tokens: list[tuple[str, str]] = []
+        word_chars = cls._WORD_CHARS
+        operator_chars = cls._OPERATOR_CHARS
+
+        i, n = 0, len(code)
+        while i < n:
+            char = code[i]
+
+            if char in word_chars:
+                start = i
+                while i < n and code[i] in word_chars:
+                    i += 1
+                tokens.append(("word", code[start:i]))
+
+            elif char == ' ':
+                start = i
+                while i < n and code[i] == ' ':
+                    i += 1
+                tokens.append(("ws", code[start:i]))
+
+            elif char in operator_chars:
+                digraph = code[i:i + 2]
+                if digraph == "//":
+                    tokens.append(("lit", '#'))
+                    i += 2
+                elif digraph in cls._DIGRAPHS:
+                    tokens.append(("op", digraph))
+                    i += 2
+                else:
+                    tokens.append(("op", char))
+                    i += 1
+
+            else:
+                return None
+
+        return tokens
+
+    def _translate_tokens(self, code: str) -> str | None:
+        """Translate the expression through a single tokenization pass.
+
+        This method is the fast path of the translator: it scans the
+        expression once and rewrites operators and keywords through direct
+        dictionary lookups, instead of running the full regex substitution
+        pipeline. Whenever the expression contains a construct whose regex
+        translation the tokenizer cannot reproduce exactly (parentheses,
+        string literals, adjacent operators...), it returns None so that
+        the caller falls back to the regex path.
+
+        Args:
+            code (str): body of the expression.
+
+        Returns:
+            str | None: the translated expression or None, if the
+                expression is out of the tokenizer's scope.
+        """
+        tokens = self._tokenize(code)
+        if tokens is None:
+            return None
+
+        out: list[str] = []
+        pending = ""
+        swallow_ws = False
+        return_seen = False
+        seen_operators: set[str] = set()
+        previous: tuple[str, str] | None = None
+
+        for index, (kind, text) in enumerate(tokens):
+            if kind == "ws":
+                if not swallow_ws:
+                    pending = text
+                continue
+
+            if kind == "word":
+                lower = text.lower()
+
+                if lower == "mod":
+                    kind, text = "op", "MOD"
+                elif lower == "devolver" and not return_seen:
+                    # Only the first DEVOLVER is rewritten, and the rule
+                    # swallows the whitespace that follows it:
+                    out.append(pending + "return ")
+                    pending = ""
+                    swallow_ws = True
+                    return_seen = True
+                    previous = (kind, text)
+                    continue
+                elif lower in self._KEYWORDS:
+                    text = self._KEYWORDS[lower]
+                elif lower in self._KEYWORD_FRAGMENTS:
+                    # The gap-tolerant identifier patterns (Car.?cter,
+                    # L.?gico) can bridge the space between two words,
+                    # which a per-token pass cannot reproduce:
+                    return None
+                elif lower != "devolver" and any(
+                    stem in lower for stem in self._KEYWORD_STEMS
+                ):
+                    return None
+
+            if kind == "op":
+                # Each substitution rule only rewrites one occurrence of
+                # its operator, so repeated operators are out of scope:
+                if text in seen_operators:
+                    return None
+                seen_operators.add(text)
+
+                # Sequences of operators interact with the substitution
+                # rules in ways the single pass cannot reproduce, except
+                # for the common unary minus:
+                if previous is not None and previous[0] == "op":
+                    if text != '-' or previous[1] == '-':
+                        return None
+
+                # Bare '=', '<' and '>' only get rewritten when they have
+                # an operand on the relevant side:
+                if text in ('=', '<', '>'):
+                    if previous is None or previous[0] != "word":
+                        return None
+
+                if text in ('<', '>'):
+                    # Both operands must provide a name character at the
+                    # edge facing the operator ('.' is not one):
+                    if previous[1].endswith('.'):
+                        return None
+
+                    following = next(
+                        (
+                            token
+                            for token in islice(tokens, index + 1, None)
+                            if token[0] != "ws"
+                        ),
+                        None
+                    )
+                    if (
+                        following is None
+                        or following[0] != "word"
+                        or following[1].startswith('.')
+                    ):
+                        return None
+
+                if out and out[-1].endswith(' '):
+                    out[-1] = out[-1][:-1]
+
+                replacement = (
+                    '%' if text == "MOD"
+                    else self._DIGRAPHS.get(text)
+                    or self._SINGLE_OPERATORS[text]
+                )
+                out.append(f" {replacement} ")
+                pending = ""
+                swallow_ws = True
+
+            else:  # Words and literals are emitted with their spacing.
+                out.append(pending + text)
+                pending = ""
+                swallow_ws = False
+
+            previous = (kind, text)
+
+        out.append(pending)
+        return "".join(out)
 
     def _translate_operators(self, code: str) -> str:
         """Translate operators in the expression.
@@ -107,13 +383,14 @@ class Expression:
         Returns:
             str: body of the expression with translated operators.
         """
-        for expression, replacement in self.OPERATORS.items():
-            code = re.sub(
-                expression,
-                replacement,
-                code,
-                flags=RegexConfig.FLAGS
-            )
+        if self._OPERATOR_GUARD.search(code) is None:
+            return code
+
+        if "//" in code:
+            code = code.replace("//", '#')
+
+        for pattern, replacement in self._COMPILED_OPERATORS:
+            code = pattern.sub(replacement, code)
 
         return code
 
@@ -126,13 +403,11 @@ class Expression:
         Returns:
             str: body of the expression with translated identifiers.
         """
-        for expression, replacement in self.IDENTIFIERS.items():
-            code = re.sub(
-                expression,
-                replacement,
-                code,
-                flags=RegexConfig.FLAGS
-            )
+        if self._IDENTIFIER_GUARD.search(code) is None:
+            return code
+
+        for pattern, replacement in self._COMPILED_IDENTIFIERS:
+            code = pattern.sub(replacement, code)
 
         return code
 
@@ -156,6 +431,7 @@ class Expression:
         return f"Expression(\"{self.body}\")"
 
 
+@total_ordering
 class Block:
     """Structural class for code organization and rendering.
 
@@ -179,6 +455,42 @@ class Block:
     FOOTER: str | None = None  # type: ignore
     EXCLUDE_LINES: tuple[str] = tuple()  # type: ignore
 
+    _HEADER_PATTERN: re.Pattern | None = None
+    _FOOTER_PATTERN: re.Pattern | None = None
+    _EXCLUDED_PATTERN: re.Pattern | None = None
+
+    __slots__ = (
+        "lines", "start", "end", "_span", "_hash", "_header", "_body",
+        "_footer", "parent", "children", "globals", "calls"
+    )
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Precompile the structural markers of the subclass.
+
+        The HEADER, FOOTER and EXCLUDE_LINES sources declared by each
+        subclass are compiled once when the class is created, so that
+        scanning and body filtering never pay pattern compilation or cache
+        lookups at match time.
+
+        Args:
+            **kwargs: the keyword arguments of the base hook.
+        """
+        super().__init_subclass__(**kwargs)
+
+        if cls.HEADER is not None:
+            cls._HEADER_PATTERN = re.compile(cls.HEADER, RegexConfig.FLAGS)
+
+        if cls.FOOTER is not None:
+            cls._FOOTER_PATTERN = re.compile(cls.FOOTER, RegexConfig.FLAGS)
+
+        if cls.EXCLUDE_LINES:
+            cls._EXCLUDED_PATTERN = re.compile(
+                '|'.join(
+                    f"(?:{expression})" for expression in cls.EXCLUDE_LINES
+                ),
+                RegexConfig.FLAGS
+            )
+
     def __init__(self, lines: Any[str | Block], start: int, end: int) -> None:
         """Initialize a new block.
 
@@ -193,6 +505,8 @@ class Block:
         self.lines = lines
         self.start = start
         self.end = end
+        self._span = (start, end)
+        self._hash = hash(self._span)
 
         self._header = self.lines[0]
         self._body = self.lines[1:-1]
@@ -208,6 +522,10 @@ class Block:
     def indent(text: Any, indentation_level: int) -> str:
         """Indent text.
 
+        The indentation prefix for each level is built once and memoized on
+        `EditorConfig`, so that rendering does not recompute the same string
+        multiplication for every line.
+
         Args:
             text (str): the text to indent.
             indentation_level (int): the indentation level.
@@ -215,8 +533,10 @@ class Block:
         Returns:
             str: the indented text.
         """
-        spacing = EditorConfig.SPACES_PER_TAB * EditorConfig.INDENTATION_CHAR
-        return f"{spacing * indentation_level}{text}"
+        if not indentation_level:
+            return str(text)
+
+        return f"{EditorConfig.indent_prefix(indentation_level)}{text}"
 
     def is_excluded(self, line: str) -> bool:
         """Determine whether a line should be excluded from the translation.
@@ -227,11 +547,8 @@ class Block:
         Returns:
             bool: True if the line should be excluded, False otherwise.
         """
-        for expression in self.EXCLUDE_LINES:
-            if re.match(expression, line, flags=RegexConfig.FLAGS):
-                return True
-
-        return False
+        pattern = self._EXCLUDED_PATTERN
+        return pattern is not None and pattern.match(line) is not None
 
     def translate(self) -> None:
         """Translate block to Python code.
@@ -291,15 +608,12 @@ class Block:
                 Expressions and Blocks or None, if the process was not
                 successful.
         """
-        lines: list[Expression | Block] = []
-
-        for line in self.lines[1:-1]:
-            if not isinstance(line, Block) and not self.is_excluded(line):
-                lines.append(Expression(line))
-            else:
-                lines.append(line)
-
-        return lines
+        return [
+            Expression(line)
+            if type(line) is str and not self.is_excluded(line)
+            else line
+            for line in islice(self.lines, 1, len(self.lines) - 1)
+        ]
 
     def collapse(self) -> None:
         """Collapse blocks that contain children blocks.
@@ -312,15 +626,17 @@ class Block:
             This method should only be called on the root blocks in order to
             prevent redundant calls.
         """
+        children = self.children
+
         reduction = 0
-        for child in sorted(self.children):
+        for child in children:
             start_i = child.start - self.start - reduction
             end_i = child.end - self.start + 1 - reduction
 
             self.lines[start_i:end_i] = [child]
             reduction += end_i - start_i - 1
 
-        for child in sorted(self.children):
+        for child in children:
             child.collapse()
 
     def render(self, indentation_level: int = 0) -> list[str]:
@@ -337,16 +653,30 @@ class Block:
         Returns:
             list[str]: the indented, expanded lines of code.
         """
-        lines: list[str] = [self.indent(self._header, indentation_level)]
+        lines: list[str] = []
+        stack: list[tuple[Any, int]] = [(self, indentation_level)]
+
+        while stack:
+            item, level = stack.pop()
+
+            if not isinstance(item, Block):
+                lines.append(item)
+
+            elif type(item).render is not Block.render:
+                lines.extend(item.render(level))
 
-        for line in self._body:  # type: ignore
-            if isinstance(line, Block):
-                sub_render = line.render(indentation_level + 1)
-                lines.extend(sub_render)
             else:
-                lines.append(self.indent(line, indentation_level + 1))
+                lines.append(item.indent(item._header, level))
+                stack.append((item.indent(item._footer, level), level))
+
+                for line in reversed(item._body):  # type: ignore
+                    if isinstance(line, Block):
+                        stack.append((line, level + 1))
+                    else:
+                        stack.append(
+                            (item.indent(line, level + 1), level + 1)
+                        )
 
-        lines.append(self.indent(self._footer, indentation_level))
         return lines
 
     def is_root(self) -> bool:
@@ -368,11 +698,11 @@ class Block:
     def tree(self, indentation_level: int = 0) -> str:
         """Render the block tree recursively.
 
-        This method is used to render the block tree recursively. This is done
-        by recursively calling the `tree` method on the children blocks. The
-        output is a list of strings with the representation of the block,
-        indented according to the indentation level (automatically incremented
-        by 1 for each recursive call).
+        This method is used to render the block tree in depth-first order.
+        The traversal uses an explicit stack instead of one recursive call
+        per child, emitting the representation of each block indented
+        according to its depth (automatically incremented by 1 for each
+        nesting level).
 
         Args:
             indentation_level (int): indentation level of the block.
@@ -380,14 +710,18 @@ class Block:
         Returns:
             str: string representation of the block tree.
         """
-        output = f"{indentation_level * '  '}{self!r}\n"
-        for child in sorted(self.children):
-            output += (
-                (indentation_level + 1) * '  '
-                + child.tree(indentation_level + 1)
-            )
+        parts: list[str] = []
+        stack = [(self, indentation_level, '')]
+
+        while stack:
+            block, level, lead = stack.pop()
+            parts.append(f"{lead}{level * '  '}{block!r}\n")
+
+            child_lead = (level + 1) * '  '
+            for child in reversed(block.children):
+                stack.append((child, level + 1, child_lead))
 
-        return output
+        return ''.join(parts)
 
     def __repr__(self) -> str:
         """Return the string representation of the block.
@@ -414,7 +748,7 @@ class Block:
         Returns:
             bool: True if the block contains the other block, False otherwise.
         """
-        return self.start < item.start and item.end < self.end
+        return self.start < item.start <= item.end < self.end
 
     def __len__(self) -> int:
         """Return the number of lines of code in the block.
@@ -437,92 +771,37 @@ class Block:
         if not isinstance(other, Block):
             return False
 
-        return self.start == other.start and self.end == other.end
-
-    def __ne__(self, other) -> bool:
-        """Determine if the block is not equal to another block.
-
-        Args:
-            other (Block): block to check.
-
-        Returns:
-            bool: True if the block is not equal to the other block, False
-                otherwise.
-        """
-        if not isinstance(other, Block):
-            return False
-
-        return not self.__eq__(other)
+        return self._span == other._span
 
     def __lt__(self, other) -> bool:
         """Determine if the block is less than another block.
 
-        Args:
-            other (Block): block to check.
-
-        Returns:
-            bool: True if the block is less than the other block, False
-                otherwise.
-        """
-        if not isinstance(other, Block):
-            return False
-
-        return self.start < other.start
-
-    def __gt__(self, other) -> bool:
-        """Determine if the block is greater than another block.
+        The remaining rich comparisons are derived from this method and
+        `Block.__eq__` through `functools.total_ordering`, all keyed on the
+        (start, end) span of the block.
 
         Args:
             other (Block): block to check.
 
         Returns:
-            bool: True if the block is greater than the other block, False
+            bool: True if the block is less than the other block, False
                 otherwise.
         """
         if not isinstance(other, Block):
             return False
 
-        return self.start > other.start
-
-    def __le__(self, other) -> bool:
-        """Determine if the block is less than or equal to another block.
-
-        Args:
-            other (Block): block to check.
-
-        Returns:
-            bool: True if the block is less than or equal to the other block,
-                False otherwise.
-        """
-        if not isinstance(other, Block):
-            return False
-
-        return self.start <= other.start
-
-    def __ge__(self, other) -> bool:
-        """Determine if the block is greater than or equal to another block.
-
-        Args:
-            other (Block): block to check.
-
-        Returns:
-            bool: True if the block is greater than or equal to the other
-                block, False otherwise.
-        """
-        if not isinstance(other, Block):
-            return False
-
-        return self.start >= other.start
+        return self._span < other._span
 
     def __hash__(self) -> int:
         """Return the hash of the block.
 
-        The hash of the block is computed using the start and end line numbers.
+        The hash of the block is computed once at construction from the start
+        and end line numbers.
 
         Returns:
             int: hash of the block.
         """
-        return hash((self.start, self.end))
+        return self._hash
 
 
 class ForLoop(Block):
@@ -543,6 +822,17 @@ class ForLoop(Block):
     FOOTER = r"^FIN_DESDE$"
     BREAKPOINTS: dict[str, str] = {}
 
+    _RANGE_PATTERN = re.compile(
+        r"^DESDE\s+(.+?)\s+HASTA\s+(.+?)(?:\s+PASO\s+(.+?))?\s+HACER$",
+        RegexConfig.FLAGS
+    )
+
+    # Shared default step for loops without a PASO clause, so stepless
+    # headers do not build a fresh expression each:
+    _DEFAULT_STEP = Expression('1')
+
+    __slots__ = ()
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
@@ -550,36 +840,28 @@ class ForLoop(Block):
             str | None: the translated header or None, if the process was not
                 successful.
         """
-        step = re.match(
-            r"^DESDE\s+(.+?)\s+HASTA\s+(.+)\s+PASO\s+(.+)\s+HACER$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
-
-        no_step = re.match(
-            r"^DESDE\s+(.+?)\s+HASTA\s+([^PASO]+?)\s+HACER$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
+        match = self._RANGE_PATTERN.match(self._header)
 
-        if step is None and no_step is None:
+        if match is None:
             return None
 
-        head = (step if step is not None else no_step).groups()
+        assignment, end_part, step_part = match.groups()
+
+        iterator_part, arrow, start_part = assignment.partition("<-")
 
-        if "<-" in head[0]:
-            iterator = Expression(head[0].split('<-')[0].strip())
-            start = Expression(head[0].split('<-')[1].strip())
-            end = Expression(head[1])
+        if arrow:
+            iterator = Expression(iterator_part.strip())
+            start = Expression(start_part.strip())
         else:
             iterator = Expression("_")
-            start = Expression(head[0])
-            end = Expression(head[1])
+            start = Expression(assignment)
 
-        if step is not None:
-            step = Expression(head[2])
-        else:
-            step = Expression('1')
+        end = Expression(end_part)
+
+        step = (
+            Expression(step_part) if step_part is not None
+            else self._DEFAULT_STEP
+        )
 
         return f"for {iterator} in range({start}, {end} + 1, {step}):"
 
@@ -610,6 +892,13 @@ class WhileLoop(Block):
     HEADER = r"^MIENTRAS.*HACER$"
     FOOTER = r"^FIN_MIENTRAS$"
 
+    _CONDITION_PATTERN = re.compile(
+        r"^MIENTRAS\s+(.+?)\s+HACER$",
+        RegexConfig.FLAGS
+    )
+
+    __slots__ = ()
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
@@ -617,11 +906,7 @@ class WhileLoop(Block):
             str | None: the translated header or None, if the process was not
                 successful.
         """
-        match = re.match(
-            r"^MIENTRAS\s+(.+?)\s+HACER$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
+        match = self._CONDITION_PATTERN.match(self._header)
 
         if match is None:
             return None
@@ -657,6 +942,13 @@ class DoWhileLoop(Block):
     HEADER = r"^HACER$"
     FOOTER = r"^MIENTRAS.*[^HACER]$"
 
+    _CONDITION_PATTERN = re.compile(
+        r"^MIENTRAS\s+(.+?)$",
+        RegexConfig.FLAGS
+    )
+
+    __slots__ = ("_temp",)
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
@@ -673,11 +965,7 @@ class DoWhileLoop(Block):
             str | None: the translated footer or None, if the process was not
                 successful.
         """
-        header = re.match(
-            r"^MIENTRAS\s+(.+?)$",
-            self._footer,
-            flags=RegexConfig.FLAGS
-        )
+        header = self._CONDITION_PATTERN.match(self._footer)
 
         if header is None:
             return None
@@ -698,24 +986,22 @@ class DoWhileLoop(Block):
         Returns:
             list[str]: the indented, expanded lines of code.
         """
-        lines: list[str] = []
-        for line in self._body:
-            if isinstance(line, Block):
-                sub_render = line.render(indentation_level)
-                lines.extend(sub_render)
-            else:
-                lines.append(self.indent(line, indentation_level))
-
-        lines.append(self.indent(f"while {self._temp}:", indentation_level))
+        first_pass: list[str] = []
+        second_pass: list[str] = []
 
         for line in self._body:
             if isinstance(line, Block):
-                sub_render = line.render(indentation_level + 1)
-                lines.extend(sub_render)
+                first_pass.extend(line.render(indentation_level))
+                second_pass.extend(line.render(indentation_level + 1))
             else:
-                lines.append(self.indent(line, indentation_level + 1))
+                first_pass.append(self.indent(line, indentation_level))
+                second_pass.append(self.indent(line, indentation_level + 1))
 
-        return lines
+        first_pass.append(
+            self.indent(f"while {self._temp}:", indentation_level)
+        )
+        first_pass.extend(second_pass)
+        return first_pass
 
 
 class IfStatement(Block):
@@ -735,6 +1021,15 @@ class IfStatement(Block):
     HEADER = r"^SI[^_].*ENTONCES$"
     FOOTER = r"^FIN_SI$"
 
+    _CONDITION_PATTERN = re.compile(
+        r"^SI\s+(.+?)\s+ENTONCES$",
+        RegexConfig.FLAGS
+    )
+
+    _ELSE_PATTERN = re.compile(r"^SI_NO.*$", RegexConfig.FLAGS)
+
+    __slots__ = ()
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
@@ -742,11 +1037,7 @@ class IfStatement(Block):
             str | None: the translated header or None, if the process was not
                 successful.
         """
-        header = re.match(
-            r"^SI\s+(.+?)\s+ENTONCES$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
+        header = self._CONDITION_PATTERN.match(self._header)
 
         if header is None:
             return None
@@ -773,9 +1064,9 @@ class IfStatement(Block):
         """
         lines: list[Expression | Block] = []
 
-        for line in self.lines[1:-1]:
-            if not isinstance(line, Block) and not self.is_excluded(line):
-                if re.match(r"^SI_NO.*$", line, flags=RegexConfig.FLAGS):
+        for line in islice(self.lines, 1, len(self.lines) - 1):
+            if type(line) is str and not self.is_excluded(line):
+                if self._ELSE_PATTERN.match(line):
                     lines.append(Expression("else:"))
                 else:
                     lines.append(Expression(line))
@@ -831,6 +1122,16 @@ class MatchStatement(Block):
     FOOTER = r"^FIN_CASO$"
     EXCLUDE_LINES: tuple[str] = (r"^SI_NO$",)
 
+    _CASE = "case %s: %s"
+    _CASE_DEFAULT = "case _: %s"
+
+    _CASE_PATTERN = re.compile(
+        r"^CASO\s+(.+?)\s+SEA$",
+        RegexConfig.FLAGS
+    )
+
+    __slots__ = ()
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
@@ -838,11 +1139,7 @@ class MatchStatement(Block):
             str | None: the translated header or None, if the process was not
                 successful.
         """
-        header = re.match(
-            r"^CASO\s+(.+?)\s+SEA$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
+        header = self._CASE_PATTERN.match(self._header)
 
         if header is None:
             return None
@@ -869,14 +1166,14 @@ class MatchStatement(Block):
         """
         lines = []
         for line in self._body:
-            if not isinstance(line, Block) and "SI_NO" not in line:
+            if type(line) is str and "SI_NO" not in line:
                 if ':' not in line and line != '':
-                    lines.append(Expression(f"case _: {line}"))
+                    lines.append(Expression(self._CASE_DEFAULT % line))
                 else:
-                    value, expression = [
-                        item.strip() for item in line.split(':')
-                    ]
-                    lines.append(Expression(f"case {value}: {expression}"))
+                    value, _, expression = line.partition(':')
+                    lines.append(Expression(
+                        self._CASE % (value.strip(), expression.strip())
+                    ))
 
         return lines  # type: ignore
 
@@ -898,6 +1195,23 @@ class Function(Block):
     HEADER = r"^.+FUNCION.+"
     FOOTER = r"^FIN_FUNCION$"
 
+    _SIGNATURE = "def %s(%s) -> %s:"
+    _SIGNATURE_WITH_GLOBALS = "def %s(%s) -> %s:\n%sglobal %s"
+
+    _SIGNATURE_PATTERN = re.compile(
+        r"^(.*?)\s+FUNCION\s+(.*?)\s*\((.*)\)$",
+        RegexConfig.FLAGS
+    )
+
+    _ARGUMENT_PATTERN = re.compile(
+        r"^(.*?)\s+(.*?):\s+(.*?)$",
+        RegexConfig.FLAGS
+    )
+
+    _START_PATTERN = re.compile(r"^INICIO$", RegexConfig.FLAGS)
+
+    __slots__ = ()
+
     @staticmethod
     def split_args(args: str) -> list[str]:
         """Split function arguments.
@@ -923,11 +1237,7 @@ class Function(Block):
         args = tuple([arg for arg in args if arg])
 
         for arg in args:
-            components = re.match(
-                r"^(.*?)\s+(.*?):\s+(.*?)$",
-                arg,
-                flags=RegexConfig.FLAGS
-            )
+            components = self._ARGUMENT_PATTERN.match(arg)
 
             if components is not None:
                 components = components.groups()
@@ -952,11 +1262,11 @@ class Function(Block):
     def filter_lines(self):
         """Filter redundant lines of code from the body."""
         start = None
-        for i, line in enumerate(self.lines[1:-1]):
+        for i, line in enumerate(islice(self.lines, 1, len(self.lines) - 1)):
             if (
-                not isinstance(line, Block)
+                type(line) is str
                 and start is None
-                and re.match(r"^INICIO$", line, flags=RegexConfig.FLAGS)
+                and self._START_PATTERN.match(line)
             ):
                 start = i + 1
 
@@ -973,12 +1283,11 @@ class Function(Block):
             str | None: the translated header or None, if the process was not
                 successful.
         """
+        if "FUNCION" not in self._header.upper():
+            return None
+
         self.filter_lines()
-        components = re.match(
-            r"^(.*?)\s+FUNCION\s+(.*?)\s*\((.*)\)$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
+        components = self._SIGNATURE_PATTERN.match(self._header)
 
         if components is not None:
             components = components.groups()
@@ -994,14 +1303,18 @@ class Function(Block):
             )
 
             if references:
-                references_str = EditorConfig.SPACES_PER_TAB \
-                    * EditorConfig.INDENTATION_CHAR
-                references_str += f"global {', '.join(references)}"
-
-                return f"def {identifier}({arguments_str}) -> {return_type}:" \
-                    + f"\n{references_str}"
-
-            return f"def {identifier}({arguments_str}) -> {return_type}:"
+                return self._SIGNATURE_WITH_GLOBALS % (
+                    identifier,
+                    arguments_str,
+                    return_type,
+                    EditorConfig.SPACES_PER_TAB
+                    * EditorConfig.INDENTATION_CHAR,
+                    ", ".join(references)
+                )
+
+            return self._SIGNATURE % (
+                identifier, arguments_str, return_type
+            )
 
         return None
 
@@ -1022,15 +1335,10 @@ class Function(Block):
                 Expressions and Blocks or None, if the process was not
                 successful.
         """
-        lines: list[Expression | Block] = []
-
-        for line in self.lines[1:-1]:
-            if not isinstance(line, Block):
-                lines.append(Expression(line))
-            else:
-                lines.append(line)
-
-        return lines
+        return [
+            Expression(line) if type(line) is str else line
+            for line in islice(self.lines, 1, len(self.lines) - 1)
+        ]
 
 
 class Procedure(Function):
@@ -1050,6 +1358,16 @@ class Procedure(Function):
     HEADER = r"^PROCEDIMIENTO.*$"
     FOOTER = r"^FIN_PROCEDIMIENTO$"
 
+    _SIGNATURE = "def %s(%s):"
+    _SIGNATURE_WITH_GLOBALS = "def %s(%s):\n%sglobal %s"
+
+    _SIGNATURE_PATTERN = re.compile(
+        r"^PROCEDIMIENTO\s+(.*?)\s*\((.*)\)$",
+        RegexConfig.FLAGS
+    )
+
+    __slots__ = ()
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
@@ -1057,12 +1375,11 @@ class Procedure(Function):
             str | None: the translated header or None, if the process was not
                 successful.
         """
+        if not self._header.upper().startswith("PROCEDIMIENTO"):
+            return None
+
         self.filter_lines()
-        components = re.match(
-            r"^PROCEDIMIENTO\s+(.*?)\s*\((.*)\)$",
-            self._header,
-            flags=RegexConfig.FLAGS
-        )
+        components = self._SIGNATURE_PATTERN.match(self._header)
 
         if components is not None:
             components = components.groups()
@@ -1077,14 +1394,15 @@ class Procedure(Function):
             )
 
             if references:
-                references_str = EditorConfig.SPACES_PER_TAB \
-                    * EditorConfig.INDENTATION_CHAR
-                references_str += f"global {', '.join(references)}"
-
-                return f"def {identifier}({arguments_str}):" \
-                    + f"\n{references_str}"
+                return self._SIGNATURE_WITH_GLOBALS % (
+                    identifier,
+                    arguments_str,
+                    EditorConfig.SPACES_PER_TAB
+                    * EditorConfig.INDENTATION_CHAR,
+                    ", ".join(references)
+                )
 
-            return f"def {identifier}({arguments_str}):"
+            return self._SIGNATURE % (identifier, arguments_str)
 
         return None
 
@@ -1106,6 +1424,8 @@ class Main(Function):
     HEADER = r"^ALGORITMO.*?$"
     FOOTER = r"^FIN$"
 
+    __slots__ = ()
+
     def _translate_header(self) -> str | None:
         """Translate block header to Python code.
 
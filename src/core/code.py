@@ -5,6 +5,8 @@ Authors:
 """
 
 
+from itertools import chain
+
 from .scanner import Scanner
 from .block import Main
 
@@ -33,16 +35,32 @@ class Code:
         self._set_calls()
 
     def _set_globals(self):
-        """Set global statements."""
-        self.globals = []
-        for block in self.scanner.blocks:
-            self.globals.extend(block.globals)
+        """Set global statements.
+
+        The joined global declaration line is computed once here, so that
+        repeated renders do not rebuild it.
+        """
+        self.globals = list(chain.from_iterable(
+            block.globals for block in self.scanner.blocks
+        ))
+        self._globals_line = (
+            f"global {', '.join(glob for glob in self.globals)}"
+            if self.globals else ''
+        )
 
     def _set_calls(self):
-        """Set call statements."""
-        self.calls = []
-        for block in self.scanner.blocks:
-            self.calls.extend(block.calls)
+        """Set call statements.
+
+        The rendered call suffix is computed once here, so that repeated
+        renders do not rebuild it.
+        """
+        self.calls = list(chain.from_iterable(
+            block.calls for block in self.scanner.blocks
+        ))
+        self._calls_suffix = (
+            '\n' + ''.join(f"\n{bottom}" for bottom in self.calls) + '\n'
+            if self.calls else ''
+        )
 
     def render(self) -> str:
         """Render the final organized code.
@@ -50,12 +68,6 @@ class Code:
         Returns:
             str: the final organized code.
         """
-        if self.calls:
-            footer = '\n'.join(str(bottom) for bottom in self.calls)
-            footer = f"\n\n{footer}\n"
-        else:
-            footer = ''
-
         main_index = None
         for i, block in enumerate(self.scanner.blocks):
             if isinstance(block, Main):
@@ -64,7 +76,7 @@ class Code:
 
         if main_index is not None and self.globals:
             self.scanner.blocks[main_index]._body = [
-                f"global {', '.join(glob for glob in self.globals)}"
+                self._globals_line
             ] + self.scanner.blocks[main_index]._body
 
-        return f"{self.scanner.render()}{footer}"
+        return f"{self.scanner.render()}{self._calls_suffix}"
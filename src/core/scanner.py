@@ -25,9 +25,34 @@ class Scanner:
         roots (list[Block]): the list of root blocks found in the code.
     """
 
+    _MARKER_PATTERN = re.compile(
+        r"DESDE|MIENTRAS|HACER|SI|CASO|FUNCION|PROCEDIMIENTO|ALGORITMO|FIN",
+        RegexConfig.FLAGS
+    )
+
+    _HEADERS_PATTERN = re.compile(
+        '|'.join(
+            f"(?P<{block_type.__name__}>{block_type.HEADER})"
+            for block_type in TYPES
+        ),
+        RegexConfig.FLAGS
+    )
+
+    _TYPES_BY_NAME = {
+        block_type.__name__: block_type for block_type in TYPES
+    }
+
     def __init__(self, code: str) -> None:
         """Initialize a scanner instance.
 
+        Args:
+            code (str): the code to be scanned.
+        """
+        self._load(code)
+
+    def _load(self, code: str) -> None:
+        """Load a piece of code, resetting any previous scan state.
+
         Args:
             code (str): the code to be scanned.
         """
@@ -36,69 +61,70 @@ class Scanner:
         self.blocks: list[Block] = []
         self.roots: list[Block] = []
 
+    def rescan(self, code: str) -> None:
+        """Scan a new piece of code, reusing the scanner instance.
+
+        This method allows callers that translate repeatedly (such as the
+        GUI input window) to keep a single scanner alive instead of
+        constructing a new one per translation.
+
+        Args:
+            code (str): the code to be scanned.
+        """
+        self._load(code)
+        self.scan()
+
     def scan(self) -> None:
         """Scan the code and find structural blocks.
 
-        This method is a public caller for the recursive `Scanner._scan`
-        method, which is responsible for iterating over the code and each
-        block type, identifying its header and footer and enclosing the body
-        in between.
+        This method is a public caller for the `Scanner._scan` method, which
+        is responsible for iterating over the code, identifying the header
+        and footer of each block type and enclosing the body in between.
         """
-        self.blocks = self._scan(start=0)
+        self.blocks = self._scan()
         self._organize()
 
-    def _scan(self, start: int, closer: Block | None = None) -> list[Block]:
+    def _scan(self) -> list[Block]:
         """Scan the code and find structural blocks.
 
-        This method iterates over each line of code and every defined block
-        type, identifying the corresponding headers and footers with each line
-        of code and classifying the blocks accordingly.
-
-        Args:
-            start (int): the index from which the search begins.
+        This method classifies each line of code exactly once: a line that
+        matches a block type header opens a block on a stack of currently
+        open blocks, and a line that matches the footer of the innermost
+        open block closes it. Blocks are collected in closing order, which
+        places every nested block before its container.
 
         Returns:
             list[Block]: the list of identified `Block` elements.
 
         Notes:
-            This method should not be called directly, since it is designed for
-            internal use and it might have undefined outputs if it is called
-            manually.
+            This method should not be called directly, since it is designed
+            for internal use and it might have undefined outputs if it is
+            called manually.
         """
-        blocks = []
-
-        i = 0
-        safe = []
-        while i < len(self.lines[start:]):
-            line = self.lines[start:][i]
-            for block_type in TYPES:
-                if closer is None:
-                    closer = block_type
+        blocks: list[Block] = []
+        stack: list[tuple[type[Block], int]] = []
 
-                header, footer = block_type.HEADER, closer.FOOTER
+        # Bind the per-line lookups once, so the loop reads locals instead
+        # of resolving class attributes on every iteration.
+        marker_search = self._MARKER_PATTERN.search
+        headers_match = self._HEADERS_PATTERN.match
+        types_by_name = self._TYPES_BY_NAME
 
-                if re.match(header, line, flags=RegexConfig.FLAGS):
-                    blocks.extend(self._scan(start + i + 1, block_type))
+        for i, line in enumerate(self.lines):
+            # Every header and footer contains one of the structural
+            # keywords, so lines without any of them (the bulk of any
+            # program body) are discarded with a single fused search.
+            if not marker_search(line):
+                continue
 
-                    if blocks:
-                        indices = {block.end: block for block in blocks}
-                        i = indices[max(indices)].end - start
+            header = headers_match(line)
 
-                if re.match(footer, line, flags=RegexConfig.FLAGS):
-                    blocks.append(
-                        closer(  # type: ignore
-                            self.lines[start - 1:start + i + 1],
-                            start - 1,
-                            start + i
-                        )
-                    )
+            if header is not None:
+                stack.append((types_by_name[header.lastgroup], i))
 
-                    return blocks
-
-            i += 1
-            safe.append(i)
-            if safe != sorted(safe):
-                return blocks
+            elif stack and stack[-1][0]._FOOTER_PATTERN.match(line):
+                block_type, start = stack.pop()
+                blocks.append(block_type(self.lines[start:i + 1], start, i))
 
         return blocks
 
@@ -106,11 +132,10 @@ class Scanner:
         """Organize scanned blocks.
 
         This method calls several other methods that set up the block
-        hierarchy, define the roots of the block tree, collapse nested blocks
+        hierarchy and the roots of the block tree, collapse nested blocks
         and translate their contents.
         """
         self._set_hierarchy()
-        self._set_roots()
         self._collapse()
         self._translate()
 
@@ -119,39 +144,37 @@ class Scanner:
 
         This method sets the hierarchy of the blocks by setting the parent
         and children attributes of each block based on the containment of some
-        blocks into others.
+        blocks into others. The blocks are walked once in ascending start
+        order with a stack of currently open blocks, so each block's closest
+        container is found without pairwise containment tests. Blocks with no
+        container are collected as roots during the same walk; both the
+        children lists and the root list end up sorted by start line.
         """
-        for block in self.blocks:
-            remaining = [other for other in self.blocks if block in other]
+        stack: list[Block] = []
+        roots: list[Block] = []
 
-            if remaining:
-                distances = {
-                    abs(other.start - block.start): other
-                    for other in remaining
-                }
-                parent = distances[min(distances)]
+        for block in sorted(self.blocks, key=lambda b: (b.start, -b.end)):
+            while stack and stack[-1].end < block.end:
+                stack.pop()
 
-                block.parent = parent
-                parent.children.append(block)
+            if stack:
+                block.parent = stack[-1]
+                stack[-1].children.append(block)
+            else:
+                roots.append(block)
 
-    def _set_roots(self) -> None:
-        """Set the root blocks.
+            stack.append(block)
 
-        This method sets the root blocks by finding the blocks that have no
-        parent.
-        """
-        self.roots = sorted(
-            [block for block in self.blocks if block.is_root()]
-        )
+        self.roots = roots
 
     def _collapse(self) -> None:
         """Collapse the contents of the blocks."""
-        for root in sorted(self.roots):
+        for root in self.roots:
             root.collapse()
 
     def _translate(self) -> None:
         """Translate scanned blocks."""
-        for block in sorted(self.blocks):
+        for block in self.blocks:
             block.translate()
 
     def render(self, collapsed: bool = False) -> str:
@@ -168,7 +191,8 @@ class Scanner:
         if collapsed:
             return ''.join(root.tree() for root in self.roots).strip()
 
-        return '\n'.join(
-            '\n'.join(root.render())
-            for root in self.roots
-        ).strip()
+        lines: list[str] = []
+        for root in self.roots:
+            lines.extend(root.render())
+
+        return '\n'.join(lines).strip()
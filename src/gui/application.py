@@ -8,12 +8,15 @@ Authors:
     Paulo Sanchez (@erlete)
 """
 
+import builtins
 import os
 import sys
+from contextlib import redirect_stdout
 from io import StringIO
-from typing import Callable
+from types import CodeType
 
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import (QMutex, QObject, QRect, QRunnable, QThreadPool,
+                          QTimer, QUrl, QWaitCondition, pyqtSignal)
 from PyQt6.QtGui import QCloseEvent, QDesktopServices, QIcon, QPixmap, QScreen
 from PyQt6.QtWidgets import (QApplication, QGridLayout, QHBoxLayout,
                              QInputDialog, QMainWindow, QPushButton,
@@ -25,34 +28,58 @@ from .labels import Footer, Header3, Subtitle, TextBoxLabel, Title
 from .text_boxes import CodeField
 
 
-def input_handler(parent: QWidget) -> Callable:
-    """Input handler generator function.
+def prompt_input(parent: QWidget) -> int | float | str | None:
+    """Prompt the user for an input value.
+
+    This function must run on the GUI thread, since it creates a modal
+    dialog.
 
     Args:
         parent (QWidget): the parent widget.
 
     Returns:
-        Callable: the custom input function.
+        int | float | str | None: the entered value, coerced to a number
+            when possible, or None if the dialog was dismissed.
     """
-    def custom_input():
-        text, ok = QInputDialog.getText(
-            parent,
-            "Input",
-            "Introduce un valor:"
-        )
-        if ok:
-            if '.' in text:
-                try:
-                    return float(text)
-                except ValueError:
-                    return text
-            else:
-                try:
-                    return int(text)
-                except ValueError:
-                    return text
+    text, ok = QInputDialog.getText(
+        parent,
+        "Input",
+        "Introduce un valor:"
+    )
+    if ok:
+        if '.' in text:
+            try:
+                return float(text)
+            except ValueError:
+                return text
+        else:
+            try:
+                return int(text)
+            except ValueError:
+                return text
+
+    return None
+
 
-    return custom_input
+_SCREEN_GEOMETRY: QRect | None = None
+
+
+def screen_geometry() -> QRect:
+    """Get the primary screen geometry.
+
+    The geometry is queried from the display server once and cached, so
+    that every window sizing itself afterwards reuses the same rectangle
+    instead of issuing a new native query.
+
+    Returns:
+        QRect: the geometry of the primary screen.
+    """
+    global _SCREEN_GEOMETRY
+
+    if _SCREEN_GEOMETRY is None:
+        _SCREEN_GEOMETRY = QScreen.geometry(QApplication.primaryScreen())
+
+    return _SCREEN_GEOMETRY
 
 
 def resource_path(relative_path):
@@ -65,6 +92,154 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+class TranslationSignals(QObject):
+    """Signal container for translation workers.
+
+    Attributes:
+        finished (pyqtSignal): signal emitted with the worker token, the
+            input source and the rendered translation once the scan has
+            finished.
+    """
+
+    finished = pyqtSignal(int, str, str)
+
+
+class TranslationWorker(QRunnable):
+    """Background worker for pseudo code translation.
+
+    Scanning large programs on the GUI thread would stall typing, so the
+    translation runs on a dedicated single-thread pool and reports its
+    result back through a signal. The token lets the window discard
+    results that were superseded by a newer edit.
+
+    Attributes:
+        token (int): the generation token of the worker.
+        code (str): the pseudo code to translate.
+        scanner (Scanner): the reusable pseudo code scanner.
+        signals (TranslationSignals): the result signals of the worker.
+    """
+
+    def __init__(self, token: int, code: str, scanner: Scanner) -> None:
+        """Initialize a translation worker instance.
+
+        Args:
+            token (int): the generation token of the worker.
+            code (str): the pseudo code to translate.
+            scanner (Scanner): the reusable pseudo code scanner.
+        """
+        super().__init__()
+        self.token = token
+        self.code = code
+        self.scanner = scanner
+        self.signals = TranslationSignals()
+
+    def run(self) -> None:
+        """Translate the code and emit the rendered result."""
+        self.scanner.rescan(self.code)
+        rendered = Code(self.scanner).render()
+        self.signals.finished.emit(self.token, self.code, rendered)
+
+
+class ExecutionSignals(QObject):
+    """Signal container for code execution workers.
+
+    Attributes:
+        finished (pyqtSignal): signal emitted with the execution output and
+            status once the code has run.
+        input_requested (pyqtSignal): signal emitted with the worker when
+            the executed code asks for an input value.
+    """
+
+    finished = pyqtSignal(str, str)
+    input_requested = pyqtSignal(object)
+
+
+class ExecutionWorker(QRunnable):
+    """Background worker for user code execution.
+
+    Running user code on the GUI thread would freeze the interface for the
+    duration of the program, so execution is dispatched to a thread pool
+    and its results are reported back through a signal. Input requests are
+    marshalled back to the GUI thread, where the dialog is legal, while
+    the worker blocks on a wait condition until the value arrives.
+
+    Attributes:
+        code (CodeType): the compiled code to execute.
+        environment (dict): the global environment for the execution.
+        signals (ExecutionSignals): the result signals of the worker.
+    """
+
+    def __init__(self, code: CodeType, environment: dict) -> None:
+        """Initialize an execution worker instance.
+
+        Args:
+            code (CodeType): the compiled code to execute.
+            environment (dict): the global environment for the execution.
+        """
+        super().__init__()
+        self.code = code
+        self.environment = environment
+        self.environment["input"] = self.request_input
+        self.signals = ExecutionSignals()
+
+        self._input_mutex = QMutex()
+        self._input_ready = QWaitCondition()
+        self._input_value: int | float | str | None = None
+
+    def request_input(self) -> int | float | str | None:
+        """Request an input value from the GUI thread.
+
+        This method runs on the worker thread: it asks the GUI thread to
+        prompt the user and blocks until `provide_input` delivers the
+        entered value.
+
+        Returns:
+            int | float | str | None: the value entered by the user.
+        """
+        self._input_mutex.lock()
+        try:
+            self.signals.input_requested.emit(self)
+            self._input_ready.wait(self._input_mutex)
+            return self._input_value
+        finally:
+            self._input_mutex.unlock()
+
+    def provide_input(self, value: int | float | str | None) -> None:
+        """Deliver an input value and wake the waiting worker.
+
+        Args:
+            value (int | float | str | None): the value entered by the
+                user.
+        """
+        self._input_mutex.lock()
+        self._input_value = value
+        self._input_ready.wakeAll()
+        self._input_mutex.unlock()
+
+    def run(self) -> None:
+        """Execute the code and emit its output and status."""
+        buffer = StringIO()
+        code_status = "OK"
+
+        try:
+            # Scoping the redirection to the `exec` call alone guarantees
+            # that standard output is restored no matter how the executed
+            # code fails.
+            with redirect_stdout(buffer):
+                exec(self.code, self.environment, self.environment)
+
+            code_output = buffer.getvalue().strip()
+
+        except Exception as exception:
+            code_output = ''
+            code_status = (
+                f"{type(exception).__name__}: "
+                f"{str(exception).capitalize()}"
+            )
+
+        self.signals.finished.emit(code_output, code_status)
+
+
 class InputWindow(QMainWindow):
     """Code input, output and execution window.
 
@@ -85,8 +260,18 @@ class InputWindow(QMainWindow):
         code_output (CodeField): the code output field.
         exec_output (CodeField): the execution output field.
         exec_status (CodeField): the execution status field.
+        scanner (Scanner): the reusable pseudo code scanner.
+        code_cache (dict[str, CodeType]): compiled user code keyed by
+            source.
+        render_cache (dict[str, str]): translated output keyed by input
+            source.
+        last_input (str | None): the most recently translated input source.
         clear_button (QPushButton): the clear button.
         exec_button (QPushButton): the execute button.
+        translate_timer (QTimer): the input translation debounce timer.
+        translation_pool (QThreadPool): the single-thread translation pool.
+        translation_token (int): the current translation generation.
+        execution_pool (QThreadPool): the single-thread execution pool.
     """
 
     LABELS: dict[str, str] = {
@@ -106,6 +291,10 @@ class InputWindow(QMainWindow):
         "exec_status": "Execution status will be displayed here..."
     }
 
+    # Each cache entry holds a whole program, so the caches are flushed
+    # once they reach this size instead of growing for the session:
+    _CACHE_LIMIT: int = 512
+
     def __init__(self, layout_parent) -> None:
         """Initialize a text input window instance.
 
@@ -114,20 +303,39 @@ class InputWindow(QMainWindow):
         """
         super().__init__()
         self.layout_parent = layout_parent
+        self.scanner = Scanner('')
+        self.code_cache: dict[str, CodeType] = {}
+        self.render_cache: dict[str, str] = {}
+        self.last_input: str | None = None
+
+        # Translations run off the GUI thread; a single-thread pool keeps
+        # the shared scanner serialized while the token discards results
+        # that a newer edit has superseded:
+        self.translation_pool = QThreadPool(self)
+        self.translation_pool.setMaxThreadCount(1)
+        self.translation_token = 0
+
+        # Executions are serialized on their own single-thread pool, so
+        # two runs never interleave their stdout redirections:
+        self.execution_pool = QThreadPool(self)
+        self.execution_pool.setMaxThreadCount(1)
 
         self.setWindowIcon(QIcon(resource_path("icon.ico")))
         # Window title and central widget:
         self.setWindowTitle(self.LABELS["title"])
         self.central_widget = QWidget()
 
-        # Set up fields, buttons, event handlers and layout:
+        # Set up fields, buttons, event handlers and layout, batching the
+        # widget insertions into a single relayout pass:
+        self.setUpdatesEnabled(False)
         self.setup_fields()
         self.setup_buttons()
         self.setup_event_handlers()
         self.setup_layout()
+        self.setUpdatesEnabled(True)
 
         # Display settings:
-        screen = QScreen.geometry(QApplication.primaryScreen())
+        screen = screen_geometry()
         self.resize(int(screen.width() * .8), int(screen.height() * .8))
 
     def setup_fields(self) -> None:
@@ -170,25 +378,25 @@ class InputWindow(QMainWindow):
         self.execute_button = QPushButton(self.LABELS["exec_button"])
 
     def setup_event_handlers(self) -> None:
-        """Set up event handlers."""
-        self.code_input.text.textChanged.connect(  # type: ignore
-            self.translate_input
-        )
+        """Set up event handlers.
 
-        self.clear_button.clicked.connect(  # type: ignore
-            self.code_input.text.clear
-        )
-
-        self.clear_button.clicked.connect(  # type: ignore
-            self.code_output.text.clear
+        Input translation is debounced through a single-shot timer, so that
+        the scanner runs once per burst of edits instead of once per
+        keystroke.
+        """
+        self.translate_timer = QTimer(self)
+        self.translate_timer.setSingleShot(True)
+        self.translate_timer.setInterval(150)
+        self.translate_timer.timeout.connect(  # type: ignore
+            self.translate_input
         )
 
-        self.clear_button.clicked.connect(  # type: ignore
-            self.exec_output.text.clear
+        self.code_input.text.textChanged.connect(  # type: ignore
+            self.translate_timer.start
         )
 
         self.clear_button.clicked.connect(  # type: ignore
-            self.exec_status.text.clear
+            self.clear_fields
         )
 
         self.execute_button.clicked.connect(  # type: ignore
@@ -222,49 +430,176 @@ class InputWindow(QMainWindow):
         self.central_widget.setLayout(layout)
         self.setCentralWidget(self.central_widget)
 
+    def clear_fields(self) -> None:
+        """Clear every text field of the window.
+
+        The four fields are cleared through a single slot with updates
+        suspended, so the clear triggers one repaint instead of four
+        separate signal dispatches and relayouts.
+        """
+        self.setUpdatesEnabled(False)
+        self.code_input.text.clear()
+        self.code_output.text.clear()
+        self.exec_output.text.clear()
+        self.exec_status.text.clear()
+        self.setUpdatesEnabled(True)
+
     def translate_input(self) -> None:
-        """Translate the input code into a valid Python code."""
-        scanner = Scanner(self.code_input.text.toPlainText())
-        scanner.scan()
-        code = Code(scanner)
-        self.code_output.text.setText(code.render())
+        """Translate the input code into a valid Python code.
 
-    def execute_code(self) -> None:
-        """Execute the code and display outputs."""
-        tmp = sys.stdout
-        sys.stdout = StringIO()  # Redirect standard output.
+        Translations are memoized per input source, so that returning to a
+        previous state (undo, redo, clearing and retyping) skips the scan
+        entirely.
+        """
+        code_input = self.code_input.text.toPlainText()
+
+        # textChanged also fires on programmatic and formatting-only edits,
+        # so identical input is dropped before any further work.
+        if code_input == self.last_input:
+            return
+
+        self.last_input = code_input
+
+        # Bumping the generation first invalidates any in-flight worker,
+        # so a slow translation of older input can never overwrite the
+        # output written below:
+        self.translation_token += 1
+
+        # The empty buffer (initial state and every clear) skips the
+        # translation pipeline entirely:
+        if not code_input:
+            self.code_output.text.setPlainText('')
+            return
+
+        rendered = self.render_cache.get(code_input)
 
+        if rendered is not None:
+            self.code_output.text.setPlainText(rendered)
+            return
+
+        worker = TranslationWorker(
+            self.translation_token, code_input, self.scanner
+        )
+        worker.signals.finished.connect(  # type: ignore
+            self.display_translation
+        )
+        self.translation_pool.start(worker)
+
+    def display_translation(
+        self,
+        token: int,
+        code_input: str,
+        rendered: str
+    ) -> None:
+        """Display a finished translation and cache its results.
+
+        Args:
+            token (int): the generation token of the finished worker.
+            code_input (str): the input source that was translated.
+            rendered (str): the rendered translation.
+        """
+        # Results superseded by a newer edit are dropped:
+        if token != self.translation_token:
+            return
+
+        if len(self.render_cache) >= self._CACHE_LIMIT:
+            self.render_cache.clear()
+
+        self.render_cache[code_input] = rendered
+
+        # Compiling right after a successful translation overlaps the
+        # idle time between keystrokes, so the execute path usually
+        # finds the code object already cached. Incomplete programs
+        # simply stay uncompiled until they parse.
+        if rendered and rendered not in self.code_cache:
+            try:
+                code_object = compile(rendered, "<translated>", "exec")
+            except SyntaxError:
+                pass
+            else:
+                if len(self.code_cache) >= self._CACHE_LIMIT:
+                    self.code_cache.clear()
+
+                self.code_cache[rendered] = code_object
+
+        self.code_output.text.setPlainText(rendered)
+
+    def execute_code(self) -> None:
+        """Execute the code on a worker thread and display its outputs."""
         code_input = self.code_output.text.toPlainText()
-        code_status = "OK"
 
-        input = input_handler(self)  # Intended builtin shadowing.
+        if not code_input:
+            self.display_execution("No executable code found.", "OK")
+            return
+
+        # Recompiling identical source on every run is wasted work, so
+        # compiled code objects are cached per source string.
+        code_object = self.code_cache.get(code_input)
+
+        if code_object is None:
+            try:
+                code_object = compile(code_input, "<translated>", "exec")
+            except SyntaxError as exception:
+                self.display_execution(
+                    '',
+                    f"{type(exception).__name__}: "
+                    f"{str(exception).capitalize()}"
+                )
+                return
+
+            if len(self.code_cache) >= self._CACHE_LIMIT:
+                self.code_cache.clear()
+
+            self.code_cache[code_input] = code_object
 
         class Registro:
 
             def __init__(self):
                 pass
 
-        try:
-            if code_input:
-                exec(code_input, locals(), locals())
-                code_output = f"{sys.stdout.getvalue().strip()}"
-            else:
-                code_output = "No executable code found."
+        # The execution environment is a small explicit dict instead of the
+        # module globals, so user-code name lookups scan three entries and
+        # never reach the UI internals. The worker adds its own blocking
+        # "input" shadow on top.
+        environment = {
+            "__builtins__": builtins.__dict__,
+            "Registro": Registro
+        }
+
+        worker = ExecutionWorker(code_object, environment)
+        worker.signals.finished.connect(  # type: ignore
+            self.display_execution
+        )
+        worker.signals.input_requested.connect(  # type: ignore
+            self.prompt_worker_input
+        )
+        self.execution_pool.start(worker)
 
-        except Exception as exception:
-            code_output = ''
-            code_status = str(exception).capitalize()
+    def prompt_worker_input(self, worker: ExecutionWorker) -> None:
+        """Prompt the user for a value and hand it to a waiting worker.
 
-        finally:
-            self.exec_output.text.setText(code_output.strip())
-            self.exec_status.text.setText(code_status.strip())
+        This slot runs on the GUI thread, where the modal input dialog is
+        legal, while the worker blocks until the value is delivered.
 
-            if code_status != "OK":
-                self.exec_status.text.setStyleSheet("color: red")
-            else:
-                self.exec_status.text.setStyleSheet("color: green")
+        Args:
+            worker (ExecutionWorker): the worker awaiting the value.
+        """
+        worker.provide_input(prompt_input(self))
+
+    def display_execution(self, code_output: str, code_status: str) -> None:
+        """Display the execution output and status.
+
+        Args:
+            code_output (str): the standard output of the execution.
+            code_status (str): the status message of the execution.
+        """
+        self.exec_output.text.setPlainText(code_output.strip())
+        self.exec_status.text.setPlainText(code_status.strip())
 
-            sys.stdout = tmp  # Restore standard output.
+        if code_status != "OK":
+            self.exec_status.text.setStyleSheet("color: red")
+        else:
+            self.exec_status.text.setStyleSheet("color: green")
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Reset the layout when the window is closed."""
@@ -278,7 +613,8 @@ class MainWindow(QMainWindow):
     Attributes:
         LABELS (dict): labels for the window.
         URL (str): URL for the application's GitHub page.
-        input_window (InputWindow): input window.
+        input_window (InputWindow | None): input window, created on first
+            use.
         layout_parent (LayoutParent): layout parent.
         logo_image (QLabel): logo image.
         slogan (QLabel): slogan label.
@@ -288,20 +624,26 @@ class MainWindow(QMainWindow):
     """
 
     LABELS = {
-        "title": "Pseudo Code Translator · v3.0"
+        "title": "Pseudo Code Translator · v3.0",
+        "slogan": "The ultimate solution for students struggling"
+                  "\nto understand how pseudo code works",
+        "copyright": "© erlete, 2022 - 2023, All Rights Reserved",
+        "transpiler": "Also try @susoferreira's pseudocode to C++ transpiler"
     }
 
     URLS = {
         "help": "https://github.com/erlete/pseudo-code-translator/wiki/"
-                + "Welcome!",
+                "Welcome!",
         "project": "https://github.com/susoferreira/PseudoCode"
     }
 
+    _LOGO: QPixmap | None = None
+
     def __init__(self):
         """Initialize the window."""
         super().__init__()
 
-        self.screen = QScreen.geometry(QApplication.primaryScreen())
+        self.screen = screen_geometry()
         self.resize(
             int(self.screen.width() * .3),
             int(self.screen.height() * .5)
@@ -311,27 +653,33 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon(resource_path("icon.ico")))
         self.setWindowTitle(self.LABELS["title"])
 
+        # Batch the widget insertions into a single relayout pass:
+        self.setUpdatesEnabled(False)
         self.setup_fields()
         self.setup_buttons()
         self.setup_event_handlers()
         self.setup_layout()
+        self.setUpdatesEnabled(True)
 
     def setup_fields(self) -> None:
-        """Set up the window fields."""
-        self.input_window = InputWindow(self)
+        """Set up the window fields.
+
+        The input window is not built here: its whole widget tree is only
+        constructed the first time the user opens the translator.
+        """
+        self.input_window: InputWindow | None = None
+
+        # Decoding the logo PNG is only done for the first window; later
+        # instances reuse the cached pixmap.
+        if MainWindow._LOGO is None:
+            MainWindow._LOGO = QPixmap(resource_path("logo_text.png"))
 
         self.logo_image = Title(self)
-        self.logo_image.setPixmap(QPixmap(resource_path("logo_text.png")))
+        self.logo_image.setPixmap(MainWindow._LOGO)
         self.logo_image.setScaledContents(False)
 
-        self.slogan = Subtitle(
-            "The ultimate solution for students struggling"
-            + "\nto understand how pseudo code works"
-        )
-
-        self.copyright_footer = Footer(
-            "© erlete, 2022 - 2023, All Rights Reserved"
-        )
+        self.slogan = Subtitle(self.LABELS["slogan"])
+        self.copyright_footer = Footer(self.LABELS["copyright"])
 
     def setup_buttons(self) -> None:
         """Set up control buttons."""
@@ -359,7 +707,6 @@ class MainWindow(QMainWindow):
         self.stacked_layout.setCurrentIndex(0)
 
         self.stacked_layout.addWidget(self.widget)
-        self.stacked_layout.addWidget(self.input_window)
 
         self.padding = QHBoxLayout()
 
@@ -368,9 +715,7 @@ class MainWindow(QMainWindow):
         self.window_area.addWidget(self.slogan)
         self.window_area.addWidget(self.info_button)
         self.window_area.addWidget(self.text_input_button)
-        self.window_area.addWidget(Header3(
-            "Also try @susoferreira's pseudocode to C++ transpiler"
-        ))
+        self.window_area.addWidget(Header3(self.LABELS["transpiler"]))
         self.window_area.addWidget(self.project_button)
         self.window_area.addWidget(self.copyright_footer)
 
@@ -385,6 +730,10 @@ class MainWindow(QMainWindow):
 
     def set_input_window(self) -> None:
         """Set the code input screen."""
+        if self.input_window is None:
+            self.input_window = InputWindow(self)
+            self.stacked_layout.addWidget(self.input_window)
+
         self.stacked_layout.setCurrentIndex(1)
         self.hide()
 
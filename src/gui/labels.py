@@ -8,16 +8,39 @@ Authors:
     Paulo Sanchez (@erlete)
 """
 
+from functools import lru_cache
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import QLabel
 
 
+@lru_cache(maxsize=None)
+def get_font(name: str, size: int, weight: QFont.Weight) -> QFont:
+    """Get a shared font instance.
+
+    Fonts are cached per (name, size, weight) combination, so that labels
+    with the same format share a single native font handle instead of
+    allocating one each.
+
+    Args:
+        name (str): the name of the font.
+        size (int): the size of the font.
+        weight (QFont.Weight): the weight of the font.
+
+    Returns:
+        QFont: the shared font instance.
+    """
+    return QFont(name, size, weight)
+
+
 class Text(QLabel):
     """Standard text label.
 
-    This class represents the standard text format of the application. Extended
-    text formats can be added by inheriting from this class.
+    This class represents the standard text format of the application.
+    Extended text formats can be added by inheriting from this class and
+    overriding the class-level format attributes, which are applied through
+    a single setup pass at construction.
 
     Attributes:
         font_name (str): the name of the font.
@@ -48,6 +71,12 @@ class Text(QLabel):
         "justify": Qt.AlignmentFlag.AlignJustify
     }
 
+    font_name = "Menlo"
+    font_size = 13
+    font_weight = WEIGHTS["normal"]
+    text_alignment = ALIGNMENTS["left"]
+    contents_margins = (11, 11, 11, 11)
+
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the text label.
 
@@ -56,18 +85,11 @@ class Text(QLabel):
             **kwargs: the keyword arguments.
         """
         super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 13
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["left"]
-        self.contents_margins = (11, 11, 11, 11)
-
         self.setup()
 
     def setup(self) -> None:
         """Set up the text label."""
-        self.setFont(QFont(
+        self.setFont(get_font(
             self.font_name,
             self.font_size,
             self.font_weight
@@ -80,200 +102,93 @@ class TextBoxLabel(Text):
     """Text box element head label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
         font_weight (QFont.Weight): the weight of the font.
         text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 12
-        self.font_weight = self.WEIGHTS["bold"]
-        self.text_alignment = self.ALIGNMENTS["center"]
-        self.contents_margins = (5, 10, 0, 5)
-
-        self.setup()
+    font_size = 12
+    font_weight = Text.WEIGHTS["bold"]
+    text_alignment = Text.ALIGNMENTS["center"]
+    contents_margins = (5, 10, 0, 5)
 
 
 class Header1(Text):
     """Header 1 text label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
-        font_weight (QFont.Weight): the weight of the font.
-        text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 20
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["left"]
-        self.contents_margins = (20, 20, 20, 20)
-
-        self.setup()
+    font_size = 20
+    contents_margins = (20, 20, 20, 20)
 
 
 class Header2(Text):
     """Header 2 text label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
-        font_weight (QFont.Weight): the weight of the font.
-        text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 18
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["left"]
-        self.contents_margins = (18, 18, 18, 18)
-
-        self.setup()
+    font_size = 18
+    contents_margins = (18, 18, 18, 18)
 
 
 class Header3(Text):
     """Header 3 text label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
-        font_weight (QFont.Weight): the weight of the font.
         text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 11
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["center"]
-        self.contents_margins = (12, 12, 12, 12)
-
-        self.setup()
+    font_size = 11
+    text_alignment = Text.ALIGNMENTS["center"]
+    contents_margins = (12, 12, 12, 12)
 
 
 class Title(Text):
     """Title text label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
-        font_weight (QFont.Weight): the weight of the font.
         text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 30
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["center"]
-        self.contents_margins = (30, 30, 30, 30)
-
-        self.setup()
+    font_size = 30
+    text_alignment = Text.ALIGNMENTS["center"]
+    contents_margins = (30, 30, 30, 30)
 
 
 class Subtitle(Text):
     """Subtitle text label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
-        font_weight (QFont.Weight): the weight of the font.
         text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 14
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["center"]
-        self.contents_margins = (14, 14, 14, 14)
-
-        self.setup()
+    font_size = 14
+    text_alignment = Text.ALIGNMENTS["center"]
+    contents_margins = (14, 14, 14, 14)
 
 
 class Footer(Text):
     """Footer text label.
 
     Attributes:
-        font_name (str): the name of the font.
         font_size (int): the size of the font.
-        font_weight (QFont.Weight): the weight of the font.
         text_alignment (Qt.AlignmentFlag): the alignment of the text.
         contents_margins (tuple): the margins of the text.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize the text label.
-
-        Args:
-            *args: the arguments.
-            **kwargs: the keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-
-        self.font_name = "Menlo"
-        self.font_size = 8
-        self.font_weight = self.WEIGHTS["normal"]
-        self.text_alignment = self.ALIGNMENTS["center"]
-        self.contents_margins = (8, 8, 8, 8)
-
-        self.setup()
+    font_size = 8
+    text_alignment = Text.ALIGNMENTS["center"]
+    contents_margins = (8, 8, 8, 8)
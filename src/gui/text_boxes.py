@@ -11,6 +11,38 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QKeyEvent
 from PyQt6.QtWidgets import QScrollArea, QTextEdit
 
+from ..config import EditorConfig
+from .labels import get_font
+
+_CODE_FONT = ("Monaco", 11, QFont.Weight.Normal)
+
+_TAB_KEY = Qt.Key.Key_Tab
+_TAB_SPACES = EditorConfig.SPACES_PER_TAB * EditorConfig.INDENTATION_CHAR
+
+_SPACE_ADVANCES: dict[str, int] = {}
+
+
+def get_space_advance(widget: QTextEdit) -> int:
+    """Get the advance of the space glyph for the widget's font.
+
+    Advances are cached per font key, so that identical fields do not each
+    allocate font metrics to measure the same glyph.
+
+    Args:
+        widget (QTextEdit): the widget whose font is measured.
+
+    Returns:
+        int: the advance of the space glyph.
+    """
+    key = widget.font().key()
+    advance = _SPACE_ADVANCES.get(key)
+
+    if advance is None:
+        advance = widget.fontMetrics().horizontalAdvance(' ')
+        _SPACE_ADVANCES[key] = advance
+
+    return advance
+
 
 class CodeField(QScrollArea):
     """A scrollable text field for code.
@@ -31,21 +63,23 @@ class CodeField(QScrollArea):
         self.setWidgetResizable(True)
 
         self._text = QTextEdit()
+
+        # Batch the property writes, so that Qt does not run an update pass
+        # per setter during construction:
+        self._text.setUpdatesEnabled(False)
         self._text.setReadOnly(read_only)
+        # Read-only fields are only ever written programmatically, so
+        # their undo stack would just accumulate memory:
+        self._text.setUndoRedoEnabled(not read_only)
         self._text.setTabChangesFocus(False)
         self._text.setContentsMargins(0, 0, 0, 0)
         self._text.setPlaceholderText(placeholder_text)
         self._text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self._text.keyPressEvent = self.key_press_event  # type: ignore
-        self._text.setTabStopDistance(
-            8 * self._text.fontMetrics().horizontalAdvance(' ')
-        )
-
-        self.setFont(QFont(
-            "Monaco",
-            11,
-            QFont.Weight.Normal
-        ))
+        self._text.setTabStopDistance(8 * get_space_advance(self._text))
+        self._text.setUpdatesEnabled(True)
+
+        self.setFont(get_font(*_CODE_FONT))
         self.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self.setContentsMargins(11, 11, 11, 11)
 
@@ -66,7 +100,7 @@ class CodeField(QScrollArea):
         Args:
             event (QKeyEvent): the key press event.
         """
-        if event.key() == 16777217:
-            self._text.insertPlainText(" " * 4)
+        if event.key() == _TAB_KEY:
+            self._text.insertPlainText(_TAB_SPACES)
         else:
             QTextEdit.keyPressEvent(self._text, event)
@@ -1,112 +1,64 @@
 import os
+from functools import lru_cache
 
+import pytest
 import regex as re
 
 from ..core.code import Code
 from ..core.scanner import Scanner
 
+TRAILING_SPACE = re.compile(r"[ \t]+$", flags=re.MULTILINE)
+EMPTY_LINE = re.compile(r"^[ \t]*\n", flags=re.MULTILINE)
 
-def strip(string: str) -> str:
-    lines = string.splitlines()
-    return "\n".join([
-        line.rstrip() for line in lines
-        if not re.match(r"^\s*$", line, flags=re.MULTILINE | re.IGNORECASE)
-    ])
-
-
-CLASS_NAMES = {
-    "TestIfStatement": "if_statement",
-    "TestMatchStatement": "match_statement",
-    "TestForLoop": "for_loop",
-    "TestWhileLoop": "while_loop",
-    "TestDoWhileLoop": "do_while_loop",
-    "TestFunction": "function",
-    "TestMainFunction": "main_function",
-    "TestProcedure": "procedure"
-}
-
-
-class BaseTest:
-
-    @classmethod
-    def setup_tests(cls):
-        name = CLASS_NAMES[cls.__name__]
-
-        cls.ROOTS = {
-            "samples": f"src/tests/samples/{name}",
-            "validations": f"src/tests/validations/{name}"
-        }
-
-        cls.SAMPLES = os.listdir(cls.ROOTS["samples"])
-
-    @classmethod
-    def block_test(cls):
-        cls.setup_tests()
-
-        for sample_name in cls.SAMPLES:
-
-            sample_file = f"{cls.ROOTS['samples']}/{sample_name}"
-            validation_file = (
-                f"{cls.ROOTS['validations']}/"
-                + f"{sample_name.replace('.txt', '.py')}"
-            )
-
-            with open(sample_file, mode='r', encoding="utf-8") as f:
-                sample = f.read()
-
-            with open(validation_file, mode='r', encoding="utf-8") as f:
-                validation = f.read()
+BLOCK_NAMES = (
+    "if_statement",
+    "match_statement",
+    "for_loop",
+    "while_loop",
+    "do_while_loop",
+    "function",
+    "main_function",
+    "procedure"
+)
 
-            scanner = Scanner(sample)
-            scanner.scan()
-            code = Code(scanner)
 
-            assert strip(code.render()) == strip(validation)
+@lru_cache(maxsize=None)
+def read_file(path: str) -> str:
+    with open(path, mode='r', encoding="utf-8") as file:
+        return file.read()
 
 
-class TestIfStatement(BaseTest):
+@lru_cache(maxsize=None)
+def list_samples(root: str) -> tuple[str, ...]:
+    return tuple(os.listdir(root))
 
-    def test(self):
-        self.block_test()
 
+@lru_cache(maxsize=None)
+def translate(path: str) -> str:
+    scanner = Scanner(read_file(path))
+    scanner.scan()
+    return Code(scanner).render()
 
-class TestMatchStatement(BaseTest):
 
-    def test(self):
-        self.block_test()
-
-
-class TestForLoop(BaseTest):
-
-    def test(self):
-        self.block_test()
-
-
-class TestWhileLoop(BaseTest):
-
-    def test(self):
-        self.block_test()
-
-
-class TestDoWhileLoop(BaseTest):
-
-    def test(self):
-        self.block_test()
-
-
-class TestFunction(BaseTest):
-
-    def test(self):
-        self.block_test()
+def strip(string: str) -> str:
+    stripped = EMPTY_LINE.sub('', TRAILING_SPACE.sub('', string))
+    return stripped.strip('\n')
 
 
-class TestMainFunction(BaseTest):
+def block_cases():
+    for block_name in BLOCK_NAMES:
+        for sample_name in list_samples(f"src/tests/samples/{block_name}"):
+            yield block_name, sample_name
 
-    def test(self):
-        self.block_test()
 
+@pytest.mark.parametrize("block_name, sample_name", tuple(block_cases()))
+def test_block(block_name, sample_name):
+    sample_file = f"src/tests/samples/{block_name}/{sample_name}"
+    validation_file = (
+        f"src/tests/validations/{block_name}/"
+        + f"{sample_name.replace('.txt', '.py')}"
+    )
 
-class TestProcedure(BaseTest):
+    validation = read_file(validation_file)
 
-    def test(self):
-        self.block_test()
+    assert strip(translate(sample_file)) == strip(validation)
@@ -1,147 +1,175 @@
 from ..core.block import Expression
 from itertools import combinations_with_replacement as comb
 
+SYMBOLS = {
+    "add": "+",
+    "as": "<-",
+    "div": "/",
+    "eq": "=",
+    "ge": ">=",
+    "gt": ">",
+    "le": "<=",
+    "lt": "<",
+    "mod": "mod",
+    "mul": "*",
+    "ne": "<>",
+    "sub": "-"
+}
+
+OPERATORS = (
+    ("-", "-"),
+    ("*", "*"),
+    ("/", "/"),
+    ("+", "+"),
+    ("<-", "="),
+    ("<", "<"),
+    ("<=", "<="),
+    ("<>", "!="),
+    ("=", "=="),
+    (">", ">"),
+    (">=", ">="),
+    ("mod", "%")
+)
+
+TERMS = (
+    ('1', '1'),
+    ('a', 'a'),
+    ('a1', 'a1'),
+    ('a_1', 'a_1'),
+    ('A', 'A'),
+    ('A1', 'A1'),
+    ('A_1', 'A_1'),
+    ('a1b2c3', 'a1b2c3'),
+    ('a_1_b_2_c_3', 'a_1_b_2_c_3')
+)
+
+SPACING_OPTIONS = (" ", "", "  ")
+SPACING = tuple(set(
+    spacing
+    for pair in comb(SPACING_OPTIONS, 2)
+    for spacing in (pair, pair[::-1])
+))
+
+# The full (input, expected) matrix is built once at import, so the twelve
+# operator test classes iterate precomputed pairs instead of regenerating
+# the same cartesian product each.
+CASES = {
+    operator: tuple(
+        (
+            ''.join((term_a, spacing_a, operator, spacing_b, term_b)),
+            f"{term_a} {replacement} {term_b}"
+        )
+        for term_a, term_b in TERMS
+        for spacing_a, spacing_b in SPACING
+    )
+    for operator, replacement in OPERATORS
+}
 
-class TestExpression:
 
-    SYMBOLS = {
-        "add": "+",
-        "as": "<-",
-        "div": "/",
-        "eq": "=",
-        "ge": ">=",
-        "gt": ">",
-        "le": "<=",
-        "lt": "<",
-        "mod": "mod",
-        "mul": "*",
-        "ne": "<>",
-        "sub": "-"
-    }
-
-    OPERATORS = {
-        "-": "-",
-        "*": "*",
-        "/": "/",
-        "+": "+",
-        "<-": "=",
-        "<": "<",
-        "<=": "<=",
-        "<>": "!=",
-        "=": "==",
-        ">": ">",
-        ">=": ">=",
-        "mod": "%"
-    }
-
-    TERMS = (
-        ('1', '1'),
-        ('a', 'a'),
-        ('a1', 'a1'),
-        ('a_1', 'a_1'),
-        ('A', 'A'),
-        ('A1', 'A1'),
-        ('A_1', 'A_1'),
-        ('a1b2c3', 'a1b2c3'),
-        ('a_1_b_2_c_3', 'a_1_b_2_c_3')
-    )
+class TestExpression:
 
-    SPACING_OPTIONS = (" ", "", "  ")
-    SPACING = list(comb(SPACING_OPTIONS, 2))
-    SPACING = list(set(
-        SPACING + [(b, a) for a, b in SPACING]
-    ))
+    __slots__ = ()
 
     @classmethod
     def expression_test(cls):
-        operator = cls.__name__.replace("Test", "").lower()
-        for term_a, term_b in cls.TERMS:
-            for spacing_a, spacing_b in cls.SPACING:
-                cls.check_operator(
-                    cls.SYMBOLS[operator],
-                    cls.OPERATORS[cls.SYMBOLS[operator]],
-                    term_a,
-                    term_b,
-                    spacing_a,
-                    spacing_b
-                )
+        operator = SYMBOLS[cls.__name__.replace("Test", "").lower()]
 
-    @classmethod
-    def check_operator(cls, operator, replacement, term_a,
-                       term_b, spacing_a, spacing_b):
-        text = f"{term_a}{spacing_a}{operator}{spacing_b}{term_b}"
-        expected = f"{term_a} {replacement} {term_b}"
-        expression = Expression(text)
-        assert expression.body == expected
+        for text, expected in CASES[operator]:
+            expression = Expression(text)
+            assert expression.body == expected
 
 
 class TestAdd(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestAs(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestDiv(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestEq(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestNe(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestLt(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestLe(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestGt(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestGe(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestMul(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestSub(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()
 
 
 class TestMod(TestExpression):
 
+    __slots__ = ()
+
     def test(self):
         self.expression_test()